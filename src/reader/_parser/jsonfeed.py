@@ -19,6 +19,12 @@ from ..types import Content
 from ..types import Enclosure
 
 
+try:
+    import orjson  # type: ignore[import-not-found,unused-ignore]
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment,unused-ignore]
+
+
 if TYPE_CHECKING:  # pragma: no cover
     from . import FeedAndEntries
     from .requests import Headers
@@ -36,12 +42,23 @@ class JSONFeedParser:
         headers: Headers | None = None,
     ) -> FeedAndEntries:
         try:
-            result = json.load(resource)
+            result = _load_json(resource.read())
         except json.JSONDecodeError as e:
             raise ParseError(url, "invalid JSON") from e
         return _process_feed(url, result)
 
 
+def _load_json(data: bytes) -> Any:
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (UTF-8 only, no NaN,
+            # no integers over 64 bits), let json have the final word
+            pass
+    return json.loads(data)
+
+
 _VERSION_URL_PREFIX = "https://jsonfeed.org/version/"
 _VERSIONS = {
     f"{_VERSION_URL_PREFIX}1.1": 'json11',
@@ -89,6 +89,11 @@ TimeoutType = Union[None, float, tuple[float, float], tuple[float, None]]
 
 DEFAULT_TIMEOUT = (3.05, 60)
 
+# By default, Requests keeps connections to at most 10 hosts around
+# (and at most 10 per host); when updating many feeds with a persistent session,
+# keeping more of them allows reusing connections (and TLS sessions) more often.
+DEFAULT_POOL_SIZE = 32
+
 
 @dataclass
 class SessionFactory:
@@ -123,7 +128,11 @@ class SessionFactory:
             request_hooks=list(self.request_hooks),
             response_hooks=list(self.response_hooks),
         )
-        timeout_adapter = TimeoutHTTPAdapter(self.timeout)
+        timeout_adapter = TimeoutHTTPAdapter(
+            self.timeout,
+            pool_connections=DEFAULT_POOL_SIZE,
+            pool_maxsize=DEFAULT_POOL_SIZE,
+        )
         session.session.mount('https://', timeout_adapter)
         session.session.mount('http://', timeout_adapter)
 
@@ -28,10 +28,10 @@
 
 import datetime
 import io
+import sys
 import time
 from typing import Dict, List, Union, IO
 import urllib.error
-import urllib.parse
 import xml.sax
 
 from .datetimes import registerDateHandler, _parse_date
@@ -54,6 +54,13 @@ PREFERRED_XML_PARSERS = ["drv_libxml2"]
 
 _XML_AVAILABLE = True
 
+# The create_parser() of the SAX driver picked by xml.sax.make_parser(),
+# set by _get_sax_parser().
+_create_sax_parser = None
+
+# The feedparser package, set by _get_defaults().
+_feedparser = None
+
 SUPPORTED_VERSIONS = {
     '': 'unknown',
     'rss090': 'RSS 0.90',
@@ -75,6 +82,14 @@ SUPPORTED_VERSIONS = {
 }
 
 
+# Prefixes of strings _open_resource() treats as URLs.
+# Note there's no //, since feed:http://... is a valid feed URI.
+_URL_SCHEMES = ('http:', 'https:', 'ftp:', 'file:', 'feed:')
+
+# Like urlparse(), ignore leading C0 control characters and spaces.
+_URL_LEADING_CHARS_TO_STRIP = ''.join(map(chr, range(0x21)))
+
+
 def _open_resource(url_file_stream_or_string, etag, modified, agent, referrer, handlers, request_headers, result):
     """URL, filename, or string --> stream
 
@@ -121,19 +136,26 @@ def _open_resource(url_file_stream_or_string, etag, modified, agent, referrer, h
     # (to reduce memory usage, see convert_file_to_utf8() for details).
     # However, to accommodate parse() needing the content twice,
     # the returned file is guaranteed to be seekable.
-    # (If the underlying resource is not seekable,
-    # the content is read and wrapped in a io.BytesIO/StringIO.)
+    # (If the underlying resource is not seekable, binary content is read
+    # on demand and kept in memory by _LazySeekableFile, and text content
+    # is read and wrapped in a io.StringIO.)
 
     if hasattr(url_file_stream_or_string, 'read'):
         if hasattr(url_file_stream_or_string, 'seekable'):
             if url_file_stream_or_string.seekable():
                 return url_file_stream_or_string
+        if isinstance(url_file_stream_or_string.read(0), bytes):
+            return _LazySeekableFile(url_file_stream_or_string)
         return _to_in_memory_file(url_file_stream_or_string.read())
 
+    # Only the scheme is needed; urlparse() would parse the whole string,
+    # which may well be an entire feed document.
     looks_like_url = (
         isinstance(url_file_stream_or_string, str)
-        and urllib.parse.urlparse(url_file_stream_or_string)[0]
-            in ('http', 'https', 'ftp', 'file', 'feed')
+        and url_file_stream_or_string[:32]
+        .lstrip(_URL_LEADING_CHARS_TO_STRIP)[:6]
+        .lower()
+        .startswith(_URL_SCHEMES)
     )
     if looks_like_url:
         data = http.get(url_file_stream_or_string, etag, modified, agent, referrer, handlers, request_headers, result)
@@ -157,12 +179,155 @@ def _open_resource(url_file_stream_or_string, etag, modified, agent, referrer, h
 
 
 def _to_in_memory_file(data):
+    # io.BytesIO(data) does not copy a bytes object,
+    # it shares its buffer until the first write (https://bugs.python.org/issue22003),
+    # so there is no need for a custom zero-copy file-like object here
+    # (or for the io.BytesIO(data) that wraps the http.get() result).
     if isinstance(data, str):
         return io.StringIO(data)
     else:
         return io.BytesIO(data)
 
 
+class _LazySeekableFile:
+    """Make a non-seekable binary file seekable, without reading it upfront.
+
+    Data is read from the underlying file only when needed
+    (allowing parsing to start before e.g. a HTTP response is fully read),
+    and kept in memory, so it can be read again after seek().
+
+    """
+    def __init__(self, file):
+        self.file = file
+        self.buffer = bytearray()
+        self.offset = 0
+        self.eof = False
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            if not self.eof:
+                self.buffer += self.file.read()
+                self.eof = True
+            end = len(self.buffer)
+        else:
+            end = self.offset + size
+            while len(self.buffer) < end and not self.eof:
+                chunk = self.file.read(end - len(self.buffer))
+                if not chunk:
+                    # An empty sized read is not always EOF; e.g. urllib3 1.x
+                    # responses with decode_content=True return b'' if
+                    # the compressed bytes read did not decode to anything.
+                    # An unsized read returns everything that is left.
+                    chunk = self.file.read()
+                    self.eof = True
+                self.buffer += chunk
+
+        with memoryview(self.buffer) as view:
+            data = bytes(view[self.offset:end])
+        self.offset += len(data)
+        return data
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.offset
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.offset
+        elif whence == io.SEEK_END:
+            self.read()
+            offset += len(self.buffer)
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"invalid whence ({whence!r})")
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset!r}")
+        self.offset = offset
+        return offset
+
+    def close(self):
+        # do not touch the underlying stream (it may belong to the user),
+        # but free the buffered data
+        self.buffer = bytearray()
+
+
+def _get_defaults():
+    """Return the current feedparser.{USER_AGENT, SANITIZE_HTML,
+    RESOLVE_RELATIVE_URIS, OPTIMISTIC_ENCODING_DETECTION} values.
+
+    The package is imported lazily (to avoid a cyclic import) and only once;
+    the values themselves are *not* cached, since users are allowed
+    to change them at any time.
+
+    """
+    global _feedparser
+    if _feedparser is None:
+        from .. import feedparser
+        _feedparser = feedparser
+    return (
+        _feedparser.USER_AGENT,
+        _feedparser.SANITIZE_HTML,
+        _feedparser.RESOLVE_RELATIVE_URIS,
+        _feedparser.OPTIMISTIC_ENCODING_DETECTION,
+    )
+
+
+def _get_sax_parser():
+    """Return a new, configured SAX parser.
+
+    xml.sax.make_parser() tries to import each of the PREFERRED_XML_PARSERS
+    on every call, which is slow if they are not installed
+    (failed imports are not cached); instead, remember the driver
+    it picked the first time, and use that to create parsers directly.
+
+    Parsers are not reused, since they keep a reference to the last
+    source (and thus the whole feed) after parsing.
+
+    """
+    global _create_sax_parser
+    if _create_sax_parser is None:
+        saxparser = xml.sax.make_parser(PREFERRED_XML_PARSERS)
+        _create_sax_parser = sys.modules[type(saxparser).__module__].create_parser
+    else:
+        saxparser = _create_sax_parser()
+
+    saxparser.setFeature(xml.sax.handler.feature_namespaces, 1)
+    # Disable downloading external doctype references and
+    # parameter entities (e.g. the external DTD subset), if possible.
+    for feature in (
+        xml.sax.handler.feature_external_ges,
+        xml.sax.handler.feature_external_pes,
+    ):
+        try:
+            saxparser.setFeature(feature, 0)
+        except (xml.sax.SAXNotSupportedException, xml.sax.SAXNotRecognizedException):
+            pass
+    return saxparser
+
+
+def _is_at_eof(file):
+    """Check if a seekable file has no more data, without consuming any.
+
+    Avoid the read(1) / seek() round-trip if possible.
+
+    """
+    # Don't special-case io.BytesIO: getbuffer() un-shares a buffer
+    # created from bytes (copying it), and getvalue() copies one
+    # that was written to; read(1) / seek() copy nothing.
+    if hasattr(file, 'peek'):
+        return not file.peek(1)
+
+    offset = file.tell()
+    if not file.read(1):
+        return True
+    file.seek(offset)
+    return False
+
+
 class LooseFeedParser(LooseXMLParser, XMLParserMixin, BaseHTMLProcessor):
     pass
 
@@ -233,17 +398,17 @@ def parse(
 
     """
 
-    # Avoid a cyclic import.
     if not agent:
-        from .. import feedparser
-        agent = feedparser.USER_AGENT
+        agent = _get_defaults()[0]
 
-    result = FeedParserDict(
-        bozo=False,
-        entries=[],
-        feed=FeedParserDict(),
-        headers={},
-    )
+    # Use a plain dict while parsing, since FeedParserDict item assignment
+    # is slower; it is converted to a FeedParserDict by _make_result().
+    result = {
+        'bozo': False,
+        'entries': [],
+        'feed': {},
+        'headers': {},
+    }
 
     try:
         file = _open_resource(url_file_stream_or_string, etag, modified, agent, referrer, handlers, request_headers, result)
@@ -252,15 +417,18 @@ def parse(
             'bozo': True,
             'bozo_exception': error,
         })
-        return result
+        return _make_result(result)
+
+    # if the server sent HTTP 304 Not Modified, there's nothing to parse,
+    # even if the response has a body; return early
+    # (http.get() already set the status, headers, and debug message)
+    if result.get('status') == 304:
+        return _make_result(result)
 
     # at this point, the file is guaranteed to be seekable;
-    # we read 1 byte/character to see if it's empty and return early
-    # (this preserves the behavior in 6.0.8)
-    initial_file_offset = file.tell()
-    if not file.read(1):
-        return result
-    file.seek(initial_file_offset)
+    # if it's empty, return early (this preserves the behavior in 6.0.8)
+    if _is_at_eof(file):
+        return _make_result(result)
 
     # overwrite existing headers using response_headers
     result['headers'].update(response_headers or {})
@@ -278,7 +446,18 @@ def parse(
             # the file does not come from the user, close it
             file.close()
 
-    return result
+    return _make_result(result)
+
+
+def _make_result(result: dict) -> FeedParserDict:
+    rv = FeedParserDict()
+    for key, value in result.items():
+        # Go through __setitem__() to apply the key mapping
+        # (e.g. http.get() sets 'modified', which is stored as 'updated').
+        rv[key] = value
+    if not isinstance(rv['feed'], FeedParserDict):
+        rv['feed'] = FeedParserDict(rv['feed'])
+    return rv
 
 
 def _parse_file_inplace(
@@ -290,14 +469,13 @@ def _parse_file_inplace(
     optimistic_encoding_detection: bool = None,
 ) -> None:
 
-    # Avoid a cyclic import.
-    from .. import feedparser
+    _, default_sanitize_html, default_resolve_relative_uris, default_optimistic = _get_defaults()
     if sanitize_html is None:
-        sanitize_html = bool(feedparser.SANITIZE_HTML)
+        sanitize_html = bool(default_sanitize_html)
     if resolve_relative_uris is None:
-        resolve_relative_uris = bool(feedparser.RESOLVE_RELATIVE_URIS)
+        resolve_relative_uris = bool(default_resolve_relative_uris)
     if optimistic_encoding_detection is None:
-        optimistic_encoding_detection = bool(feedparser.OPTIMISTIC_ENCODING_DETECTION)
+        optimistic_encoding_detection = bool(default_optimistic)
 
     stream_factory = convert_file_to_utf8(
         result['headers'], file, result, optimistic_encoding_detection
@@ -349,13 +527,7 @@ def _parse_file_inplace(
         feed_parser = StrictFeedParser(baseuri, baselang, 'utf-8')
         feed_parser.resolve_relative_uris = resolve_relative_uris
         feed_parser.sanitize_html = sanitize_html
-        saxparser = xml.sax.make_parser(PREFERRED_XML_PARSERS)
-        saxparser.setFeature(xml.sax.handler.feature_namespaces, 1)
-        try:
-            # Disable downloading external doctype references, if possible.
-            saxparser.setFeature(xml.sax.handler.feature_external_ges, 0)
-        except xml.sax.SAXNotSupportedException:
-            pass
+        saxparser = _get_sax_parser()
         saxparser.setContentHandler(feed_parser)
         saxparser.setErrorHandler(feed_parser)
         source = xml.sax.xmlreader.InputSource()
@@ -383,19 +555,13 @@ def _parse_file_inplace(
 
         # If an encoding was detected, use it; otherwise, assume utf-8 and do your best.
         # Will raise io.UnsupportedOperation if the underlying file is not seekable.
-        data =  stream_factory.get_text_file('utf-8', 'replace').read()
-
-        # As of 6.0.8, LooseFeedParser.feed() can be called exactly once
-        # with the entire data (it does some re.sub() and str.replace() on it).
-        #
-        # SGMLParser (of which LooseFeedParser is a subclass)
-        # *can* be fed in a streaming fashion,
-        # by calling feed() repeatedly with chunks of text.
-        #
-        # When/if LooseFeedParser will support being fed chunks,
-        # replace the read() call above with read(size)/feed() calls in a loop.
-
-        feed_parser.feed(data)
+        text_file = stream_factory.get_text_file('utf-8', 'replace')
+
+        # LooseFeedParser.feed() can be called exactly once with the entire data
+        # (it does some re.sub() and str.replace() on it);
+        # feed_file() reads and feeds the data in chunks instead,
+        # taking care to not split any of the replaced substrings.
+        feed_parser.feed_file(text_file)
 
     result['feed'] = feed_parser.feeddata
     result['entries'] = feed_parser.entries
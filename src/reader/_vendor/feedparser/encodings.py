@@ -31,17 +31,6 @@ import codecs
 import io
 import re
 
-try:
-    try:
-        import cchardet as chardet # type: ignore[import]
-    except ImportError:
-        import chardet # type: ignore[no-redef]
-except ImportError:
-    lazy_chardet_encoding = None
-else:
-    def lazy_chardet_encoding(data):
-        return chardet.detect(data)['encoding'] or ''
-
 from .exceptions import (
     CharacterEncodingOverride,
     CharacterEncodingUnknown,
@@ -67,6 +56,58 @@ RE_XML_DECLARATION = re.compile(r'^<\?xml[^>]*?>')
 # Example: <?xml version="1.0" encoding="utf-8"?>
 RE_XML_PI_ENCODING = re.compile(br'^<\?.*encoding=[\'"](.*?)[\'"].*\?>')
 
+# How much of the document to look at when searching for the XML declaration.
+# The declaration must be at the very start, and is rarely longer than 100 bytes;
+# looking at the entire document is slow (especially if it must be decoded first,
+# or if it is all on a single line, because of the .* in RE_XML_PI_ENCODING).
+XML_DECLARATION_SNIFF_LEN = 2 ** 10
+
+
+# How much of the document to pass to the character encoding detector.
+# Detectors are slow, and their confidence doesn't improve much past this
+# (encoding declarations are at the very start of the document anyway).
+CHARDET_PREFIX_LEN = 2 ** 13
+
+# Cached by lazy_chardet_encoding(); False means "not looked up yet".
+_chardet_detect = False
+
+
+def _get_chardet_detect():
+    """Return a function that guesses the encoding of some bytes,
+    using cchardet or chardet, or None if neither is installed.
+
+    charset_normalizer is not used: Requests always installs it, so it would
+    turn on (slow) detection for everyone, ahead of the utf-8 / windows-1252
+    fallbacks.
+
+    """
+    try:
+        import cchardet # type: ignore[import]
+    except ImportError:
+        pass
+    else:
+        return lambda data: cchardet.detect(data)['encoding']
+
+    try:
+        import chardet # type: ignore[import]
+    except ImportError:
+        pass
+    else:
+        return lambda data: chardet.detect(data)['encoding']
+
+    return None
+
+
+def lazy_chardet_encoding(data):
+    # The libraries are imported on first use, since they are
+    # only needed if none of the declared encodings work.
+    global _chardet_detect
+    if _chardet_detect is False:
+        _chardet_detect = _get_chardet_detect()
+    if _chardet_detect is None:
+        return ''
+    return _chardet_detect(data[:CHARDET_PREFIX_LEN]) or ''
+
 
 def convert_to_utf8(http_headers, data, result):
     """Detect and convert the character encoding to UTF-8.
@@ -152,10 +193,13 @@ def convert_to_utf8(http_headers, data, result):
     elif data[:4] == UTF32LE_MARKER:
         bom_encoding = 'utf-32le'
 
-    tempdata = data
+    tempdata = data[:XML_DECLARATION_SNIFF_LEN]
     try:
         if bom_encoding:
-            tempdata = data.decode(bom_encoding).encode('utf-8')
+            # An incremental decoder doesn't fail if the prefix
+            # ends in the middle of a code point.
+            decoder = codecs.getincrementaldecoder(bom_encoding)()
+            tempdata = decoder.decode(tempdata).encode('utf-8')
     except UnicodeDecodeError:
         xml_encoding_match = None
     else:
@@ -297,6 +341,9 @@ def convert_to_utf8(http_headers, data, result):
 # How much to read from a binary file in order to detect encoding.
 # In inital tests, 4k was enough for ~160 mostly-English feeds;
 # 64k seems like a safe margin.
+# Besides detection, the prefix also determines which encoding is used
+# to decode the rest of the file, so don't make it too small;
+# the detector only sees CHARDET_PREFIX_LEN of it.
 CONVERT_FILE_PREFIX_LEN = 2 ** 16
 
 # How much to read from a text file, and use as an utf-8 bytes prefix.
@@ -484,6 +531,9 @@ class StreamFactory:
         if isinstance(self.file.read(0), str):
             file = PrefixFileWrapper(self.prefix.decode(encoding), self.file)
         else:
+            # No need for an "is it all ASCII?" fast path before decoding;
+            # the CPython UTF-8 decoder already has one, and checking
+            # first (bytes.isascii() + decode('ascii')) is actually slower.
             file = PrefixFileWrapper(
                 self.prefix.decode('utf-8', errors),
                 codecs.getreader(encoding)(self.file, errors)
@@ -61,6 +61,42 @@ _cp1252 = {
 }
 
 
+def _split_incomplete_markup(data):
+    """Split data into (head, rest), such that none of the substitutions
+    in BaseHTMLProcessor._preprocess() can match across the boundary,
+    and head does not end in the middle of a CDATA section.
+
+    The substitutions start with a '<' (and end at the next '>'),
+    or with a '&' (and end at the next ';'). The latter also keeps
+    SGMLParser from seeing a partial entity or character reference
+    (e.g. '&#x20' of '&#x2019;') at the end of the data,
+    which it would treat as text.
+
+    CDATA sections must be complete because the loose parser
+    treats an unterminated one as going to the end of the document.
+
+    :type data: str
+    :rtype: Tuple[str, str]
+    """
+
+    end = len(data)
+    while True:
+        old_end = end
+        i = data.rfind('<', 0, end)
+        if i != -1 and data.find('>', i, end) == -1:
+            end = i
+        i = data.rfind(']]>', 0, end)
+        i = data.find('<![CDATA[', 0 if i == -1 else i + 3, end)
+        if i != -1:
+            end = i
+        i = data.rfind('&', 0, end)
+        if i != -1 and data.find(';', i, end) == -1:
+            end = i
+        # moving the end may have made something else incomplete
+        if end == old_end:
+            return data[:end], data[end:]
+
+
 class BaseHTMLProcessor(sgmllib.SGMLParser):
     special = re.compile("""[<>'"]""")
     bare_ampersand = re.compile(r"&(?!#\d+;|#x[0-9a-fA-F]+;|\w+;)")
@@ -133,17 +169,53 @@ class BaseHTMLProcessor(sgmllib.SGMLParser):
                 self.unknown_endtag(self.lasttag)
         return j
 
-    def feed(self, data):
+    def _preprocess(self, data):
         """
         :type data: str
-        :rtype: None
+        :rtype: str
         """
 
-        data = re.sub(r'<!((?!DOCTYPE|--|\[))', r'&lt;!\1', data, re.IGNORECASE)
+        data = re.sub(r'<!((?!DOCTYPE|--|\[))', r'&lt;!\1', data, flags=re.IGNORECASE)
         data = re.sub(r'<([^<>\s]+?)\s*/>', self._shorttag_replace, data)
         data = data.replace('&#39;', "'")
         data = data.replace('&#34;', '"')
-        super().feed(data)
+        return data
+
+    def feed(self, data):
+        """
+        :type data: str
+        :rtype: None
+        """
+
+        super().feed(self._preprocess(data))
+        super().close()
+
+    def feed_file(self, file, chunk_size=2**16, max_rest_chunks=16):
+        """Like feed(file.read()), but read and parse the data in chunks.
+
+        If the incomplete markup carried over between chunks grows
+        past max_rest_chunks chunks (e.g. because of an unterminated
+        CDATA section), the rest of the file is fed at once, like feed()
+        would; otherwise, it would be re-scanned for every new chunk.
+
+        :type file: IO[str]
+        :type chunk_size: int
+        :type max_rest_chunks: int
+        :rtype: None
+        """
+
+        max_rest = chunk_size * max_rest_chunks
+        rest = ''
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            if len(rest) > max_rest:
+                rest += chunk + file.read()
+                break
+            data, rest = _split_incomplete_markup(rest + chunk)
+            super().feed(self._preprocess(data))
+        super().feed(self._preprocess(rest))
         super().close()
 
     @staticmethod
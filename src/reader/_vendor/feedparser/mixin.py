@@ -30,6 +30,7 @@ import binascii
 import copy
 import html.entities
 import re
+import sys
 from typing import Dict
 import xml.sax.saxutils
 
@@ -40,6 +41,27 @@ from .util import FeedParserDict
 from .urls import _urljoin, make_safe_absolute_uri, resolve_relative_uris
 
 
+# Tag names are rebuilt as new strings for every element
+# (by the strict parser's namespace handling, or by sgmllib);
+# map the common RSS / Atom ones to a single interned instance,
+# so the ones kept around (e.g. on the element stack) are shared,
+# and comparisons against literals can short-circuit on identity.
+_TAG_INTERN = {tag: sys.intern(tag) for tag in (
+    'rss', 'rdf:rdf', 'channel', 'item', 'feed', 'entry', 'source',
+    'title', 'subtitle', 'description', 'summary', 'content', 'content:encoded',
+    'link', 'id', 'guid', 'pubdate', 'updated', 'published', 'modified', 'issued',
+    'created', 'lastbuilddate', 'author', 'contributor', 'name', 'email', 'uri',
+    'category', 'comments', 'enclosure', 'generator', 'rights', 'copyright',
+    'language', 'image', 'url', 'icon', 'logo', 'ttl', 'docs',
+    'dc:creator', 'dc:date', 'dc:subject', 'dc:title', 'dc:description',
+    'dc:language', 'dc:rights', 'dc:publisher', 'dc:contributor',
+    'atom:link', 'atom10:link', 'media:content', 'media:thumbnail',
+    'media:description', 'media:title', 'itunes:author', 'itunes:summary',
+    'itunes:image', 'itunes:duration', 'itunes:explicit', 'itunes:category',
+    'p', 'a', 'br', 'div', 'span', 'img', 'xhtml:div',
+)}
+
+
 class XMLParserMixin(
         _base.Namespace,
         cc.Namespace,
@@ -213,6 +235,8 @@ class XMLParserMixin(
         raise NotImplementedError
 
     def unknown_starttag(self, tag, attrs):
+        tag = _TAG_INTERN.get(tag, tag)
+
         # increment depth counter
         self.depth += 1
 
@@ -303,6 +327,8 @@ class XMLParserMixin(
                 context[unknown_tag] = attrs_d
 
     def unknown_endtag(self, tag):
+        tag = _TAG_INTERN.get(tag, tag)
+
         # match namespaces
         if tag.find(':') != -1:
             prefix, suffix = tag.split(':', 1)
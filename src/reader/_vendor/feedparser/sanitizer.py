@@ -886,6 +886,10 @@ def sanitize_html(html_source, encoding, _type):
     return data
 
 
+# Match the start of the first element (one that doesn't begin with '<?' or '<!').
+# Example: <feed
+RE_FIRST_ELEMENT_PATTERN = re.compile(br'<\w')
+
 # Match XML entity declarations.
 # Example: <!ENTITY copyright "(C)">
 RE_ENTITY_PATTERN = re.compile(br'^\s*<!ENTITY([^>]*?)>', re.MULTILINE)
@@ -912,17 +916,24 @@ def replace_doctype(data):
 
     # Divide the document into two groups by finding the location
     # of the first element that doesn't begin with '<?' or '<!'.
-    start = re.search(br'<\w', data)
+    start = RE_FIRST_ELEMENT_PATTERN.search(data)
     start = start and start.start() or -1
     head, data = data[:start+1], data[start+1:]
 
-    # Save and then remove all of the ENTITY declarations.
-    entity_results = RE_ENTITY_PATTERN.findall(head)
-    head = RE_ENTITY_PATTERN.sub(b'', head)
+    # Save and then remove all of the ENTITY declarations
+    # (in a single pass, instead of a findall() and a sub()).
+    entity_results = []
+
+    def remove_entity(match):
+        entity_results.append(match.group(1))
+        return b''
+
+    head = RE_ENTITY_PATTERN.sub(remove_entity, head)
 
     # Find the DOCTYPE declaration and check the feed type.
-    doctype_results = RE_DOCTYPE_PATTERN.findall(head)
-    doctype = doctype_results and doctype_results[0] or b''
+    # The matches are reused below to replace the DOCTYPE.
+    doctype_matches = list(RE_DOCTYPE_PATTERN.finditer(head))
+    doctype = doctype_matches and doctype_matches[0].group(1) or b''
     if b'netscape' in doctype.lower():
         version = 'rss091n'
     else:
@@ -930,7 +941,7 @@ def replace_doctype(data):
 
     # Re-insert the safe ENTITY declarations if a DOCTYPE was found.
     replacement = b''
-    if len(doctype_results) == 1 and entity_results:
+    if len(doctype_matches) == 1 and entity_results:
         safe_entities = [
             e
             for e in entity_results
@@ -940,7 +951,17 @@ def replace_doctype(data):
             replacement = b'<!DOCTYPE feed [\n<!ENTITY' \
                         + b'>\n<!ENTITY '.join(safe_entities) \
                         + b'>\n]>'
-    data = RE_DOCTYPE_PATTERN.sub(replacement, head) + data
+
+    # Same as RE_DOCTYPE_PATTERN.sub(replacement, head), without searching again.
+    parts = []
+    end = 0
+    for match in doctype_matches:
+        parts.append(head[end:match.start()])
+        parts.append(replacement)
+        end = match.end()
+    parts.append(head[end:])
+    parts.append(data)
+    data = b''.join(parts)
 
     # Precompute the safe entities for the loose parser.
     safe_entities = {
@@ -25,6 +25,7 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import functools
 import re
 import urllib.parse
 
@@ -58,6 +59,7 @@ def _urljoin(base, uri):
     return uri
 
 
+@functools.lru_cache(maxsize=256)
 def convert_to_idn(url):
     """Convert a URL to IDN notation"""
     # this function should only be called with a unicode string
@@ -83,9 +85,26 @@ def convert_to_idn(url):
         return url
 
 
+# URIs longer than this are not cached by make_safe_absolute_uri();
+# they are rarely repeated, and can be huge (e.g. data: URIs).
+MAX_CACHED_URI_LEN = 512
+
+
 def make_safe_absolute_uri(base, rel=None):
+    # The same URIs show up over and over (feed links, images in entries),
+    # and urljoin() / urlparse() are slow, so cache the result.
+    # ACCEPTABLE_URI_SCHEMES is part of the key, so it can still be changed
+    # (tuple() makes it hashable if it was set to a list).
+    acceptable_uri_schemes = tuple(ACCEPTABLE_URI_SCHEMES)
+    if len(base or '') + len(rel or '') > MAX_CACHED_URI_LEN:
+        return _make_safe_absolute_uri.__wrapped__(base, rel, acceptable_uri_schemes)
+    return _make_safe_absolute_uri(base, rel, acceptable_uri_schemes)
+
+
+@functools.lru_cache(maxsize=256)
+def _make_safe_absolute_uri(base, rel, acceptable_uri_schemes):
     # bail if ACCEPTABLE_URI_SCHEMES is empty
-    if not ACCEPTABLE_URI_SCHEMES:
+    if not acceptable_uri_schemes:
         return _urljoin(base, rel or '')
     if not base:
         return rel or ''
@@ -94,11 +113,11 @@ def make_safe_absolute_uri(base, rel=None):
             scheme = urllib.parse.urlparse(base)[0]
         except ValueError:
             return ''
-        if not scheme or scheme in ACCEPTABLE_URI_SCHEMES:
+        if not scheme or scheme in acceptable_uri_schemes:
             return base
         return ''
     uri = _urljoin(base, rel)
-    if uri.strip().split(':', 1)[0] not in ACCEPTABLE_URI_SCHEMES:
+    if uri.strip().split(':', 1)[0] not in acceptable_uri_schemes:
         return ''
     return uri
 
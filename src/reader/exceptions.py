@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from collections.abc import Sequence
-from functools import cached_property
 from traceback import format_exception
 from typing import TYPE_CHECKING
 
@@ -46,25 +45,29 @@ class _FancyExceptionBase(Exception):
         """
         return self._message or self._default_message
 
-    @cached_property
-    def _cause_name(self) -> str:
-        if not self.__cause__:
-            return ''
-        t = type(self.__cause__)
-        return f'{t.__module__}.{t.__qualname__}'
+    # __cause__ as string; only set on the instance before pickling,
+    # since most exceptions never get pickled (or even stringified).
+    _cause_name: str = ''
+    _cause_str: str = ''
 
-    @cached_property
-    def _cause_str(self) -> str:
-        return str(self.__cause__) if self.__cause__ else ''
+    def _get_cause_name_and_str(self) -> tuple[str, str]:
+        cause = self.__cause__
+        if not cause:
+            return self._cause_name, self._cause_str
+        t = type(cause)
+        return f'{t.__module__}.{t.__qualname__}', str(cause)
 
     def __reduce__(self) -> object:  # type: ignore
-        # "prime" the cached properties before pickling
-        str(self)
+        self._cause_name, self._cause_str = self._get_cause_name_and_str()
         return super().__reduce__()
 
     def __str__(self) -> str:
-        parts = [self.message, self._str, self._cause_name, self._cause_str]
-        return ': '.join(filter(None, parts))
+        cause_name, cause_str = self._get_cause_name_and_str()
+        rv = self.message
+        for part in (self._str, cause_name, cause_str):
+            if part:
+                rv = f'{rv}: {part}' if rv else part
+        return rv
 
 
 class _ExceptionGroup(Exception):  # pragma: no cover
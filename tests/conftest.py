@@ -76,6 +76,11 @@ def make_reader(request):
 
 @pytest.fixture
 def reader():
+    # Function-scoped on purpose: a new in-memory reader takes <1ms,
+    # and sharing one (with a savepoint rolled back after each test)
+    # would not isolate the many tests that change reader attributes
+    # (_parser, _now, plugins), enable search, or close the reader;
+    # also, storage methods commit, releasing any outer savepoint.
     with closing(original_make_reader(':memory:', feed_root='')) as reader:
         yield reader
 
@@ -1,5 +1,4 @@
 import threading
-from collections import OrderedDict
 from contextlib import nullcontext
 from dataclasses import dataclass
 from dataclasses import field
@@ -52,6 +51,9 @@ class Parser:
     exc: Exception = None
     is_not_modified: bool = False
 
+    # url -> feed number; rebuilt by parse() if feeds was changed directly
+    feed_numbers_by_url: dict = field(default_factory=dict, repr=False, compare=False)
+
     @classmethod
     def from_parser(cls, other):
         return cls(other.feeds, other.entries)
@@ -59,7 +61,13 @@ class Parser:
     def feed(self, number, updated=None, **kwargs):
         feed = _make_feed(number, updated, **kwargs)
         self.feeds[number] = feed
-        self.entries.setdefault(number, OrderedDict())
+        self.feed_numbers_by_url[feed.url] = number
+        self.entries.setdefault(number, {})
+        return feed
+
+    def touch_feed(self, number, updated=None):
+        """Like feed(), but only change updated, keeping everything else."""
+        feed = self.feeds[number] = self.feeds[number]._replace(updated=updated)
         return feed
 
     def entry(self, feed_number, number, updated=None, **kwargs):
@@ -67,6 +75,15 @@ class Parser:
         self.entries[feed_number][number] = entry
         return entry
 
+    def add_entries(self, feed_number, rows, **kwargs):
+        """Like entry(), but for many (number, updated) pairs at once."""
+        entries = {
+            number: _make_entry(feed_number, number, updated, **kwargs)
+            for number, updated in rows
+        }
+        self.entries[feed_number].update(entries)
+        return list(entries.values())
+
     def raise_exc(self, cond=None, exc=None):
         self.reset_mode()
         if isinstance(cond, Exception):
@@ -111,11 +128,14 @@ class Parser:
     def parse(self, url, result):
         assert result.resource.read() == b'opaque', result
 
-        for feed_number, feed in self.feeds.items():
-            if feed.url == url:
-                break
-        else:
-            raise RuntimeError(f"unkown feed: {url}")
+        feed_number = self.feed_numbers_by_url.get(url)
+        feed = self.feeds.get(feed_number)
+        if not feed or feed.url != url:
+            self.feed_numbers_by_url = {f.url: n for n, f in self.feeds.items()}
+            feed_number = self.feed_numbers_by_url.get(url)
+            if feed_number is None:
+                raise RuntimeError(f"unkown feed: {url}")
+            feed = self.feeds[feed_number]
 
         entries = list(self.entries[feed_number].values())
 
@@ -139,6 +159,9 @@ class Parser:
 class BlockingParser(Parser):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Events and not a Barrier, since retrieve() may be called
+        # more than once (e.g. update_feeds() with many feeds / workers);
+        # once set, an event lets all (past and future) calls through.
         self.in_parser = threading.Event()
         self.can_return_from_parser = threading.Event()
 
@@ -44,6 +44,24 @@ def test_fancy_exception_base():
     assert str(exc) == 'another message: URL: builtins.Exception: cause'
 
 
+def test_fancy_exception_base_pickle():
+    exc = _FancyExceptionBase('message')
+    unpickled_exc = pickle.loads(pickle.dumps(exc))
+    assert unpickled_exc.__cause__ is None
+    assert str(unpickled_exc) == 'message'
+
+    exc = _FancyExceptionBase('message')
+    exc.__cause__ = Exception('cause')
+    unpickled_exc = pickle.loads(pickle.dumps(exc))
+    # __cause__ is lost, but its string representation is kept
+    assert unpickled_exc.__cause__ is None
+    assert str(unpickled_exc) == 'message: builtins.Exception: cause'
+
+    # ... even if pickled again
+    unpickled_exc = pickle.loads(pickle.dumps(unpickled_exc))
+    assert str(unpickled_exc) == 'message: builtins.Exception: cause'
+
+
 def _all_classes(cls):
     yield cls
     for subclass in cls.__subclasses__():
@@ -0,0 +1,465 @@
+"""Tests for changes made to the vendored feedparser."""
+
+import gc
+import gzip
+import io
+import json
+import tracemalloc
+import weakref
+import xml.sax
+
+import pytest
+import urllib3
+
+from reader._vendor import feedparser
+
+
+@pytest.mark.parametrize('optimistic_encoding_detection', [False, True])
+def test_wrong_declared_encoding_falls_back_to_windows_1252(
+    optimistic_encoding_detection,
+):
+    # charset_normalizer is always installed (Requests needs it),
+    # but should not be used to guess the encoding
+    data = (
+        b'<?xml version="1.0" encoding="utf-8"?>'
+        b'<rss version="2.0"><channel>'
+        b'<title>\x93quoted\x94 na\xefve r\xe9sum\xe9</title>'
+        b'</channel></rss>'
+    )
+    result = feedparser.parse(
+        io.BytesIO(data),
+        optimistic_encoding_detection=optimistic_encoding_detection,
+    )
+    assert result.encoding == 'windows-1252'
+    assert result.feed.title == '“quoted” na\xefve r\xe9sum\xe9'
+    assert isinstance(result.bozo_exception, feedparser.CharacterEncodingOverride)
+
+
+def test_optimistic_encoding_detection_bad_byte_after_detector_prefix():
+    # the whole CONVERT_FILE_PREFIX_LEN prefix decides the encoding
+    # used for the rest of the file, not just what the detector sees
+    data = (
+        b'<?xml version="1.0" encoding="utf-8"?>'
+        b'<rss version="2.0"><channel><title>title</title>'
+        + b'<item><title>item</title></item>' * 300
+        + b'<item><title>caf\xe9</title></item>'
+        b'</channel></rss>'
+    )
+    assert 2**13 < data.index(b'\xe9') < 2**16
+
+    result = feedparser.parse(io.BytesIO(data), optimistic_encoding_detection=True)
+    assert result.encoding == 'windows-1252'
+    assert result.entries[-1].title == 'caf\xe9'
+    assert isinstance(result.bozo_exception, feedparser.CharacterEncodingOverride)
+
+
+def test_sax_parser_does_not_keep_feed_alive():
+    # the SAX driver is cached, but parsers keep a reference
+    # to the last source after parsing, so they shouldn't be
+    data = b'<rss version="2.0"><channel><title>title</title></channel></rss>'
+
+    for _ in range(2):
+        file = io.BytesIO(data)
+        file_ref = weakref.ref(file)
+        result = feedparser.parse(file)
+        assert not result.bozo
+        assert result.feed.title == 'title'
+
+        del file
+        gc.collect()
+        assert file_ref() is None
+
+    assert feedparser.api._create_sax_parser is not None
+
+
+def test_make_safe_absolute_uri_cache(monkeypatch):
+    from reader._vendor.feedparser import urls
+
+    urls._make_safe_absolute_uri.cache_clear()
+    assert (
+        urls.make_safe_absolute_uri('http://example.com/', 'a.png')
+        == 'http://example.com/a.png'
+    )
+    assert urls._make_safe_absolute_uri.cache_info().currsize == 1
+
+    # long URIs (e.g. data: URIs) are not cached
+    data_uri = 'data:image/png;base64,' + 'A' * urls.MAX_CACHED_URI_LEN
+    assert urls.make_safe_absolute_uri('http://example.com/', data_uri) == ''
+    assert urls._make_safe_absolute_uri.cache_info().currsize == 1
+
+    # ACCEPTABLE_URI_SCHEMES can be a list, and changes take effect
+    monkeypatch.setattr(urls, 'ACCEPTABLE_URI_SCHEMES', ['http', 'data'])
+    assert urls.make_safe_absolute_uri('http://example.com/', data_uri) == data_uri
+    assert urls.make_safe_absolute_uri('http://example.com/', 'ftp://x/') == ''
+
+
+@pytest.mark.parametrize(
+    'data, head, rest',
+    [
+        ('', '', ''),
+        ('text', 'text', ''),
+        ('<b>text</b>', '<b>text</b>', ''),
+        # tags
+        ('text<', 'text', '<'),
+        ('text<br', 'text', '<br'),
+        ('text<br/', 'text', '<br/'),
+        ('<p class="a">text<a href="x', '<p class="a">text', '<a href="x'),
+        # entities and character references
+        ('text&', 'text', '&'),
+        ('text&amp', 'text', '&amp'),
+        ('text&amp;', 'text&amp;', ''),
+        ('text&#x20', 'text', '&#x20'),
+        ('text&#x2019;&#82', 'text&#x2019;', '&#82'),
+        ('a & b', 'a ', '& b'),
+        ('a & b;', 'a & b;', ''),
+        # CDATA sections
+        ('text<![CDATA[', 'text', '<![CDATA['),
+        ('text<![CDATA[<b>&', 'text', '<![CDATA[<b>&'),
+        ('text<![CDATA[x]]>', 'text<![CDATA[x]]>', ''),
+        ('<![CDATA[x]]>text<![CDATA[y]', '<![CDATA[x]]>text', '<![CDATA[y]'),
+        # comments
+        ('text<!-- x', 'text', '<!-- x'),
+        ('text<!-- x -->', 'text<!-- x -->', ''),
+        # moving the end makes something else incomplete
+        ('<a href="&amp;">&', '<a href="&amp;">', '&'),
+        ('<a title="&">&amp', '', '<a title="&">&amp'),
+    ],
+)
+def test_split_incomplete_markup(data, head, rest):
+    from reader._vendor.feedparser.html import _split_incomplete_markup
+
+    assert _split_incomplete_markup(data) == (head, rest)
+
+
+FEED_FILE_CONTENTS = [
+    'text &amp; &lt;b&gt; &#39;quoted&#34; &#x2019;&#8217; &eacute;&hellip;',
+    'a & b; a &b c; &',
+    '<b>bold</b> <br/><br /> <img src="a.png"/> <a href="/x?a=1&amp;b=2">link</a>',
+    '<![CDATA[<i>x</i> & y]]> after <![CDATA[&#x2019;]]>',
+    '<!-- <b> &amp; --> after <!x> <!DOCTYPE x>',
+]
+
+
+def make_feed_file_document(content):
+    return (
+        '<rss version="2.0"><channel>'
+        f'<title>{content}</title>'
+        f'<item><title>{content}</title><description>{content}</description></item>'
+        '</channel></rss>'
+    )
+
+
+def loose_parse(document, file=None, **kwargs):
+    from reader._vendor.feedparser.api import LooseFeedParser
+
+    parser = LooseFeedParser('http://example.com/', None, 'utf-8', {})
+    if file is None:
+        parser.feed(document)
+    else:
+        parser.feed_file(file, **kwargs)
+    return parser.feeddata, parser.entries
+
+
+@pytest.mark.parametrize('content', FEED_FILE_CONTENTS)
+def test_feed_file_matches_feed(content):
+    document = make_feed_file_document(content)
+    expected = loose_parse(document)
+    assert expected[1]
+
+    # every possible chunk boundary
+    for chunk_size in range(1, len(document) + 1):
+        actual = loose_parse(document, io.StringIO(document), chunk_size=chunk_size)
+        assert actual == expected, chunk_size
+
+
+def test_feed_file_unterminated_cdata():
+    # the rest of the document is carried over from chunk to chunk;
+    # once it gets too big, it should be fed at once
+    document = make_feed_file_document('<![CDATA[' + 'x &amp; <b>y</b> ' * 100)
+
+    class File(io.StringIO):
+        read_sizes = []
+
+        def read(self, size=-1):
+            self.read_sizes.append(size)
+            return super().read(size)
+
+    file = File(document)
+    actual = loose_parse(document, file, chunk_size=16, max_rest_chunks=4)
+    assert actual == loose_parse(document)
+    assert file.read_sizes[-1] == -1
+    assert len(file.read_sizes) < 16
+
+
+def test_feed_file_character_reference_at_default_chunk_boundary():
+    # reader parses with the default (64 KiB) chunk size;
+    # start with the declaration parse() would add, so offsets don't change
+    document = "<?xml version='1.0' encoding='utf-8'?>"
+    document += make_feed_file_document('&#x2019;')
+    # the boundary is after '&#x20'
+    padding = 2**16 - document.index('&#x2019;') - 5
+    document = document.replace('?>', '?>' + ' ' * padding, 1)
+    assert document[2**16 - 5 : 2**16 + 3] == '&#x2019;'
+
+    # invalid, to force the loose parser
+    result = feedparser.parse(document.encode() + b'<')
+    assert result.bozo
+    assert result.feed.title == '’'
+    assert result.entries[0].title == '’'
+
+
+def make_bytes_io(data):
+    return io.BytesIO(data)
+
+
+def make_buffered_reader(data):
+    # has peek()
+    return io.BufferedReader(io.BytesIO(data))
+
+
+def make_string_io(data):
+    return io.StringIO(data.decode())
+
+
+@pytest.mark.parametrize(
+    'make_file', [make_bytes_io, make_buffered_reader, make_string_io]
+)
+@pytest.mark.parametrize('data', [b'', b'a', b'abc'])
+@pytest.mark.parametrize('offset', [0, 1])
+def test_is_at_eof(make_file, data, offset):
+    from reader._vendor.feedparser.api import _is_at_eof
+
+    file = make_file(data)
+    file.seek(offset)
+    assert _is_at_eof(file) == (offset >= len(data))
+    assert file.tell() == offset
+    assert len(file.read()) == len(data[offset:])
+
+
+def test_is_at_eof_does_not_copy_bytes_io():
+    from reader._vendor.feedparser.api import _is_at_eof
+
+    size = 2**20
+    # keep a reference, so the buffer is really shared
+    data = b'a' * size
+    file = io.BytesIO(data)
+    tracemalloc.start()
+    try:
+        assert not _is_at_eof(file)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < size / 10
+
+
+class NonSeekableFile(io.RawIOBase):
+    def __init__(self, data):
+        self.file = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self.file.readinto(buffer)
+
+
+def make_lazy_seekable_file(data):
+    from reader._vendor.feedparser.api import _LazySeekableFile
+
+    return _LazySeekableFile(io.BufferedReader(NonSeekableFile(data)))
+
+
+def test_lazy_seekable_file_read():
+    file = make_lazy_seekable_file(b'abcdef')
+    assert file.readable()
+    assert file.seekable()
+
+    assert file.read(0) == b''
+    assert file.tell() == 0
+    assert file.read(2) == b'ab'
+    assert file.tell() == 2
+    assert file.read(0) == b''
+    assert file.read(-1) == b'cdef'
+    assert file.tell() == 6
+    assert file.read(2) == b''
+    assert file.read(None) == b''
+
+
+def test_lazy_seekable_file_seek():
+    file = make_lazy_seekable_file(b'abcdef')
+    assert file.read(3) == b'abc'
+
+    assert file.seek(1) == 1
+    assert file.read(1) == b'b'
+    assert file.seek(1, io.SEEK_CUR) == 3
+    assert file.read() == b'def'
+
+    file = make_lazy_seekable_file(b'abcdef')
+    assert file.seek(-2, io.SEEK_END) == 4
+    assert file.read() == b'ef'
+    assert file.seek(0) == 0
+    assert file.read() == b'abcdef'
+
+    # seeking past the end of data that was not read yet
+    file = make_lazy_seekable_file(b'abcdef')
+    assert file.seek(4) == 4
+    assert file.read(1) == b'e'
+    assert file.seek(10) == 10
+    assert file.read() == b''
+
+    with pytest.raises(ValueError):
+        file.seek(-1)
+    with pytest.raises(ValueError):
+        file.seek(0, 3)
+
+
+class EmptySizedReadsFile(NonSeekableFile):
+    """Sized reads return b'' before EOF every other time,
+    like urllib3 1.x responses with decode_content=True can."""
+
+    empty = False
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return self.file.read()
+        self.empty = not self.empty
+        if self.empty:
+            return b''
+        return self.file.read(size)
+
+
+def test_lazy_seekable_file_empty_sized_read_is_not_eof():
+    from reader._vendor.feedparser.api import _LazySeekableFile
+
+    file = _LazySeekableFile(EmptySizedReadsFile(b'abcdef'))
+    assert file.read(1) == b'a'
+    assert file.read(2) == b'bc'
+    assert file.seek(0, io.SEEK_END) == 6
+    assert file.seek(0) == 0
+    assert file.read() == b'abcdef'
+
+
+NON_SEEKABLE_RSS = (
+    b'<?xml version="1.0" encoding="utf-8"?>'
+    b'<rss version="2.0"><channel><title>title</title>'
+    b'<item><title>one</title></item>'
+    b'<item><title>two</title></item>'
+    b'</channel></rss>'
+)
+
+
+@pytest.mark.parametrize('optimistic_encoding_detection', [False, True])
+def test_parse_non_seekable_strict(optimistic_encoding_detection):
+    result = feedparser.parse(
+        io.BufferedReader(NonSeekableFile(NON_SEEKABLE_RSS)),
+        optimistic_encoding_detection=optimistic_encoding_detection,
+    )
+    assert not result.bozo
+    assert result.feed.title == 'title'
+    assert [e.title for e in result.entries] == ['one', 'two']
+
+
+@pytest.mark.parametrize('optimistic_encoding_detection', [False, True])
+def test_parse_non_seekable_loose_fallback(optimistic_encoding_detection):
+    # the strict parser fails after reading everything,
+    # so the loose parser must seek back and read the data again
+    data = NON_SEEKABLE_RSS.replace(b'<title>one', b'<title>o&nbsp;ne')
+    result = feedparser.parse(
+        io.BufferedReader(NonSeekableFile(data)),
+        optimistic_encoding_detection=optimistic_encoding_detection,
+    )
+    assert result.bozo
+    assert isinstance(result.bozo_exception, xml.sax.SAXException)
+    assert result.feed.title == 'title'
+    assert [e.title for e in result.entries] == ['o\xa0ne', 'two']
+
+
+@pytest.mark.parametrize('optimistic_encoding_detection', [False, True])
+def test_non_seekable_json(optimistic_encoding_detection):
+    # parse() never uses JSONParser (it checks for a content type
+    # convert_file_to_utf8() doesn't return), so do what it would do
+    from reader._vendor.feedparser.encodings import convert_file_to_utf8
+    from reader._vendor.feedparser.parsers.json import JSONParser
+
+    data = json.dumps(
+        {
+            'version': 'https://jsonfeed.org/version/1.1',
+            'title': 'title',
+            'items': [{'id': '1', 'title': 'one'}, {'id': '2', 'title': 'two'}],
+        }
+    ).encode()
+    result = {}
+    stream_factory = convert_file_to_utf8(
+        {'content-type': 'application/json'},
+        make_lazy_seekable_file(data),
+        result,
+        optimistic_encoding_detection,
+    )
+    assert result['content-type'] == 'application/feed+json'
+
+    parser = JSONParser()
+    parser.feed(stream_factory.get_file())
+    assert parser.version == 'json11'
+    assert parser.feeddata.title == 'title'
+    assert [e.title for e in parser.entries] == ['one', 'two']
+
+
+def test_parse_gzip_urllib3_response():
+    # reader passes response.raw to feedparser as-is
+    response = urllib3.HTTPResponse(
+        io.BytesIO(gzip.compress(NON_SEEKABLE_RSS)),
+        headers={'content-encoding': 'gzip'},
+        status=200,
+        preload_content=False,
+        decode_content=True,
+    )
+    result = feedparser.parse(response)
+    assert not result.bozo
+    assert result.version == 'rss20'
+    assert [e.title for e in result.entries] == ['one', 'two']
+
+
+@pytest.mark.parametrize(
+    'html, expected',
+    [
+        # all <!...> declarations are escaped, not just the first two
+        (
+            '<p>a</p><!x1><!x2><!x3><p>b</p>',
+            '<p>a</p>&lt;!x1>&lt;!x2>&lt;!x3><p>b</p>',
+        ),
+        # doctypes are dropped regardless of case
+        ('<!DOCTYPE html><p>b</p>', '<p>b</p>'),
+        ('<!doctype html><p>b</p>', '<p>b</p>'),
+    ],
+)
+def test_sanitize_html_declarations(html, expected):
+    from reader._vendor.feedparser.sanitizer import sanitize_html
+
+    assert sanitize_html(html, 'utf-8', 'text/html') == expected
+
+
+@pytest.mark.parametrize(
+    'url_or_document, is_url',
+    [
+        ('http://example.com/', True),
+        ('HTTPS://example.com/', True),
+        ('feed:http://example.com/', True),
+        # urlparse() strips leading C0 control characters and spaces
+        (' http://example.com/', True),
+        ('\n\t\x01 https://example.com/', True),
+        ('example.com', False),
+        (' <rss version="2.0"><link>http://example.com/</link></rss>', False),
+    ],
+)
+def test_open_resource_url(monkeypatch, url_or_document, is_url):
+    from reader._vendor.feedparser import api
+
+    urls = []
+
+    def get(url, *args):
+        urls.append(url)
+        return b''
+
+    monkeypatch.setattr(api.http, 'get', get)
+    feedparser.parse(url_or_document)
+    assert urls == ([url_or_document] if is_url else [])
@@ -660,7 +660,21 @@ def test_no_version():
     assert 'missing or bad JSON Feed version' in excinfo.value.message
 
 
-def test_jsonfeed_invalid_json():
+@pytest.fixture(params=[True, False], ids=['orjson', 'no-orjson'])
+def maybe_orjson(request, monkeypatch):
+    # orjson is used if installed; check json is used if it is not
+    if not request.param:
+        monkeypatch.setattr('reader._parser.jsonfeed.orjson', None)
+
+
+def test_jsonfeed_valid_json(maybe_orjson):
+    text = '{"version": "https://jsonfeed.org/version/1.1", "title": "title"}'
+    feed, entries = jsonfeed_parse('url', text)
+    assert feed.title == 'title'
+    assert entries == []
+
+
+def test_jsonfeed_invalid_json(maybe_orjson):
     with pytest.raises(ParseError) as excinfo:
         jsonfeed_parse('url', "malformed JSON")
     assert excinfo.value.url == 'url'
@@ -668,6 +682,14 @@ def test_jsonfeed_invalid_json():
     assert isinstance(excinfo.value.__cause__, json.JSONDecodeError)
 
 
+def test_jsonfeed_non_utf8_json(maybe_orjson):
+    # orjson (if installed) only supports UTF-8; json should be used instead
+    text = '{"version": "https://jsonfeed.org/version/1.1", "items": []}'
+    feed, entries = jsonfeed_parse('url', text.encode('utf-16'))
+    assert feed.version == 'json11'
+    assert entries == []
+
+
 @pytest.fixture
 def make_http_set_headers_url(requests_mock):
     def make_url(feed_path, headers=None):
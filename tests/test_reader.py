@@ -17,20 +17,16 @@ from fakeparser import Parser
 from reader import Content
 from reader import Enclosure
 from reader import Entry
-from reader import EntryCounts
 from reader import EntryError
 from reader import EntryExistsError
 from reader import EntryNotFoundError
-from reader import EntrySearchCounts
 from reader import Feed
-from reader import FeedCounts
 from reader import FeedExistsError
 from reader import FeedNotFoundError
 from reader import InvalidFeedURLError
 from reader import ParseError
 from reader import Reader
 from reader import StorageError
-from reader import TagNotFoundError
 from reader import UpdatedFeed
 from reader import UpdateResult
 from reader._storage import Storage
@@ -39,14 +35,9 @@ from reader._types import FeedFilter
 from reader._types import FeedUpdateIntent
 from reader_methods import enable_and_update_search
 from reader_methods import get_entries
-from reader_methods import get_entries_random
-from reader_methods import get_entries_recent
 from reader_methods import get_feeds
 from reader_methods import search_entries
-from reader_methods import search_entries_random
-from reader_methods import search_entries_recent
-from reader_methods import search_entries_relevant
-from utils import make_url_base
+from utils import disable_fsync
 from utils import rename_argument
 from utils import utc_datetime
 from utils import utc_datetime as datetime
@@ -81,13 +72,13 @@ def test_update_feed_updated(reader, update_feed, caplog):
     feed = old_feed.as_feed(
         added=datetime(2010, 1, 1), last_updated=datetime(2010, 1, 2)
     )
-    assert set(reader.get_entries()) == {
+    assert list(reader.get_entries()) == [
         entry_one.as_entry(
             feed=feed,
             added=datetime(2010, 1, 2),
             last_updated=datetime(2010, 1, 2),
         )
-    }
+    ]
     assert "feed has no last_updated, treating as updated" in caplog.text
     caplog.clear()
 
@@ -101,18 +92,18 @@ def test_update_feed_updated(reader, update_feed, caplog):
     feed = old_feed.as_feed(
         added=datetime(2010, 1, 1), last_updated=datetime(2010, 1, 3)
     )
-    assert set(reader.get_entries()) == {
-        entry_one.as_entry(
-            feed=feed,
-            added=datetime(2010, 1, 2),
-            last_updated=datetime(2010, 1, 2),
-        ),
+    assert list(reader.get_entries()) == [
         entry_two.as_entry(
             feed=feed,
             added=datetime(2010, 1, 3),
             last_updated=datetime(2010, 1, 3),
         ),
-    }
+        entry_one.as_entry(
+            feed=feed,
+            added=datetime(2010, 1, 2),
+            last_updated=datetime(2010, 1, 2),
+        ),
+    ]
     assert "feed not updated, updating entries anyway" in caplog.text
     caplog.clear()
 
@@ -132,7 +123,7 @@ def test_update_feed_updated(reader, update_feed, caplog):
 
     # The feed doesn't change, because .updated is older.
     # Entries get updated regardless.
-    old_feed = parser.feed(1, datetime(2009, 1, 1), title='old-different-title')
+    old_feed = parser.touch_feed(1, datetime(2009, 1, 1))
     entry_three = parser.entry(1, 3, datetime(2010, 2, 1))
     reader._now = lambda: datetime(2010, 1, 4)
 
@@ -146,28 +137,28 @@ def test_update_feed_updated(reader, update_feed, caplog):
         # changes because entries changed
         last_updated=datetime(2010, 1, 4),
     )
-    assert set(reader.get_entries()) == {
-        entry_one.as_entry(
+    assert list(reader.get_entries()) == [
+        entry_three.as_entry(
             feed=feed,
-            added=datetime(2010, 1, 2),
-            last_updated=datetime(2010, 1, 2),
+            added=datetime(2010, 1, 4),
+            last_updated=datetime(2010, 1, 4),
         ),
         entry_two.as_entry(
             feed=feed,
             added=datetime(2010, 1, 3),
             last_updated=datetime(2010, 1, 3),
         ),
-        entry_three.as_entry(
+        entry_one.as_entry(
             feed=feed,
-            added=datetime(2010, 1, 4),
-            last_updated=datetime(2010, 1, 4),
+            added=datetime(2010, 1, 2),
+            last_updated=datetime(2010, 1, 2),
         ),
-    }
+    ]
     assert "feed not updated, updating entries anyway" in caplog.text
     caplog.clear()
 
     # The feed doesn't change; despite being newer, no entries have changed.
-    old_feed = parser.feed(1, datetime(2010, 1, 2), title='old-different-title')
+    old_feed = parser.touch_feed(1, datetime(2010, 1, 2))
     reader._now = lambda: datetime(2010, 1, 4, 12)
 
     with caplog.at_level(logging.DEBUG, logger='reader'):
@@ -180,23 +171,23 @@ def test_update_feed_updated(reader, update_feed, caplog):
         # doesn't change because nothing changed
         last_updated=datetime(2010, 1, 4),
     )
-    assert set(reader.get_entries()) == {
-        entry_one.as_entry(
+    assert list(reader.get_entries()) == [
+        entry_three.as_entry(
             feed=feed,
-            added=datetime(2010, 1, 2),
-            last_updated=datetime(2010, 1, 2),
+            added=datetime(2010, 1, 4),
+            last_updated=datetime(2010, 1, 4),
         ),
         entry_two.as_entry(
             feed=feed,
             added=datetime(2010, 1, 3),
             last_updated=datetime(2010, 1, 3),
         ),
-        entry_three.as_entry(
+        entry_one.as_entry(
             feed=feed,
-            added=datetime(2010, 1, 4),
-            last_updated=datetime(2010, 1, 4),
+            added=datetime(2010, 1, 2),
+            last_updated=datetime(2010, 1, 2),
         ),
-    }
+    ]
     assert "feed not updated, updating entries anyway" in caplog.text
     caplog.clear()
 
@@ -211,28 +202,28 @@ def test_update_feed_updated(reader, update_feed, caplog):
     with caplog.at_level(logging.DEBUG, logger='reader'):
         update_feed(reader, old_feed.url)
 
-    assert set(reader.get_entries()) == {
-        entry_one.as_entry(
-            feed=feed,
-            added=datetime(2010, 1, 2),
-            last_updated=datetime(2010, 1, 2),
-        ),
-        entry_two.as_entry(
+    assert list(reader.get_entries()) == [
+        entry_four.as_entry(
             feed=feed,
-            added=datetime(2010, 1, 3),
-            last_updated=datetime(2010, 1, 3),
+            added=datetime(2010, 1, 5),
+            last_updated=datetime(2010, 1, 5),
         ),
         entry_three.as_entry(
             feed=feed,
             added=datetime(2010, 1, 4),
             last_updated=datetime(2010, 1, 4),
         ),
-        entry_four.as_entry(
+        entry_two.as_entry(
             feed=feed,
-            added=datetime(2010, 1, 5),
-            last_updated=datetime(2010, 1, 5),
+            added=datetime(2010, 1, 3),
+            last_updated=datetime(2010, 1, 3),
         ),
-    }
+        entry_one.as_entry(
+            feed=feed,
+            added=datetime(2010, 1, 2),
+            last_updated=datetime(2010, 1, 2),
+        ),
+    ]
     assert "feed updated" in caplog.text
     caplog.clear()
 
@@ -258,18 +249,18 @@ def test_update_entry_updated(reader, update_feed, caplog, monkeypatch):
 
     feed = feed.as_feed(added=datetime(2010, 2, 1), last_updated=datetime(2010, 2, 2))
 
-    assert set(reader.get_entries()) == {
+    assert list(reader.get_entries()) == [
         old_entry.as_entry(
             feed=feed,
             added=datetime(2010, 2, 2),
             last_updated=datetime(2010, 2, 2),
         )
-    }
+    ]
     assert "entry new, updating" in caplog.text
     caplog.clear()
 
     # Feed newer (doesn't change), entry remains unchanged.
-    feed = parser.feed(1, datetime(2010, 1, 2))
+    feed = parser.touch_feed(1, datetime(2010, 1, 2))
     reader._now = lambda: datetime(2010, 2, 3)
 
     with caplog.at_level(logging.DEBUG, logger='reader'):
@@ -280,19 +271,19 @@ def test_update_entry_updated(reader, update_feed, caplog, monkeypatch):
         updated=datetime(2010, 1, 1),
         last_updated=datetime(2010, 2, 2),
     )
-    assert set(reader.get_entries()) == {
+    assert list(reader.get_entries()) == [
         old_entry.as_entry(
             feed=feed,
             added=datetime(2010, 2, 2),
             last_updated=datetime(2010, 2, 2),
         )
-    }
+    ]
     assert "entry not updated, skipping" in caplog.text
     assert "entry hash changed, updating" not in caplog.text
     caplog.clear()
 
     # Feed does not change, entry hash changes.
-    feed = parser.feed(1, datetime(2010, 1, 2))
+    feed = parser.touch_feed(1, datetime(2010, 1, 2))
     new_entry = old_entry._replace(title='New Entry')
     parser.entries[1][1] = new_entry
     reader._now = lambda: datetime(2010, 2, 3, 12)
@@ -303,18 +294,18 @@ def test_update_entry_updated(reader, update_feed, caplog, monkeypatch):
     feed = feed.as_feed(
         added=datetime(2010, 2, 1), last_updated=datetime(2010, 2, 3, 12)
     )
-    assert set(reader.get_entries()) == {
+    assert list(reader.get_entries()) == [
         new_entry.as_entry(
             feed=feed,
             added=datetime(2010, 2, 2),
             last_updated=datetime(2010, 2, 3, 12),
         )
-    }
+    ]
     assert "entry hash changed, updating" in caplog.text
     caplog.clear()
 
     # Entry is newer.
-    feed = parser.feed(1, datetime(2010, 1, 3))
+    feed = parser.touch_feed(1, datetime(2010, 1, 3))
     new_entry = new_entry._replace(updated=datetime(2010, 1, 2))
     parser.entries[1][1] = new_entry
     reader._now = lambda: datetime(2010, 2, 4)
@@ -323,13 +314,13 @@ def test_update_entry_updated(reader, update_feed, caplog, monkeypatch):
         update_feed(reader, feed.url)
 
     feed = feed.as_feed(added=datetime(2010, 2, 1), last_updated=datetime(2010, 2, 4))
-    assert set(reader.get_entries()) == {
+    assert list(reader.get_entries()) == [
         new_entry.as_entry(
             feed=feed,
             added=datetime(2010, 2, 2),
             last_updated=datetime(2010, 2, 4),
         )
-    }
+    ]
     assert "entry updated, updating" in caplog.text
     caplog.clear()
 
@@ -368,7 +359,7 @@ def test_update_no_updated(reader, chunk_size, update_feed):
     update_feed(reader, feed)
     feed = feed.as_feed(added=datetime(2010, 1, 1), last_updated=datetime(2010, 1, 1))
 
-    assert set(reader.get_feeds()) == {feed}
+    assert list(reader.get_feeds()) == [feed]
     assert set(reader.get_entries()) == {
         entry_one.as_entry(
             feed=feed,
@@ -385,7 +376,7 @@ def test_update_no_updated(reader, chunk_size, update_feed):
     update_feed(reader, feed)
     feed = feed.as_feed(added=datetime(2010, 1, 1), last_updated=datetime(2010, 1, 2))
 
-    assert set(reader.get_feeds()) == {feed}
+    assert list(reader.get_feeds()) == [feed]
     assert set(reader.get_entries()) == {
         entry_one.as_entry(
             feed=feed,
@@ -410,6 +401,7 @@ def test_update_blocking(db_path, make_reader, update_feed):
     feed2 = parser.feed(2, datetime(2010, 1, 1))
 
     reader = make_reader(db_path)
+    disable_fsync(reader)
     reader._parser = parser
 
     reader.add_feed(feed.url)
@@ -423,6 +415,7 @@ def test_update_blocking(db_path, make_reader, update_feed):
         from reader import make_reader
 
         reader = make_reader(db_path)
+        disable_fsync(reader)
         reader._parser = blocking_parser
         try:
             update_feed(reader, feed.url)
@@ -452,7 +445,7 @@ def test_update_not_modified(reader, update_feed):
     reader.add_feed(feed.url)
     update_feed(reader, feed.url)
 
-    parser.feed(1, datetime(2010, 1, 2))
+    parser.touch_feed(1, datetime(2010, 1, 2))
     parser.entry(1, 1, datetime(2010, 1, 2))
 
     reader._parser.not_modified()
@@ -472,7 +465,7 @@ def test_update_new(reader):
     reader.add_feed(one.url)
     reader.update_feeds(new=True)
 
-    assert len(set(reader.get_feeds())) == 1
+    assert len(list(reader.get_feeds())) == 1
     assert set(reader.get_entries()) == set()
 
     one = parser.feed(1, datetime(2010, 2, 1), title='title')
@@ -492,7 +485,7 @@ def test_update_new(reader):
     reader.update_feeds(new=True)
 
     two = two.as_feed(added=datetime(2010, 1, 1, 12), last_updated=datetime(2010, 1, 2))
-    assert len(set(reader.get_feeds())) == 2
+    assert len(list(reader.get_feeds())) == 2
     assert set(reader.get_entries()) == {
         entry_two.as_entry(
             feed=two,
@@ -505,7 +498,7 @@ def test_update_new(reader):
     reader.update_feeds()
 
     one = one.as_feed(added=datetime(2010, 1, 1), last_updated=datetime(2010, 1, 3))
-    assert len(set(reader.get_feeds())) == 2
+    assert len(list(reader.get_feeds())) == 2
     assert set(reader.get_entries()) == {
         entry_one.as_entry(
             feed=one,
@@ -847,6 +840,7 @@ def test_update_feed_deleted(
 
     parser = Parser()
     reader = make_reader(db_path)
+    disable_fsync(reader)
     reader._parser = parser
 
     feed = parser.feed(1, datetime(2010, 1, 1))
@@ -869,6 +863,7 @@ def test_update_feed_deleted(
     def target():
         blocking_parser.in_parser.wait()
         try:
+            disable_fsync(reader)
             reader.delete_feed(feed.url)
         finally:
             blocking_parser.can_return_from_parser.set()
@@ -919,7 +914,10 @@ def test_update_feed(reader, feed_arg):
     reader.add_feed(two.url)
     reader.update_feed(feed_arg(one))
 
-    assert set(reader.get_feeds()) == {one, Feed(two.url, added=datetime(2010, 1, 1))}
+    assert sorted(reader.get_feeds(), key=lambda f: f.url) == [
+        one,
+        Feed(two.url, added=datetime(2010, 1, 1)),
+    ]
     assert reader.get_feed(one.url) == one
     assert reader.get_feed(two.url) == Feed(two.url, added=datetime(2010, 1, 1))
     assert set(reader.get_entries()) == {
@@ -932,7 +930,7 @@ def test_update_feed(reader, feed_arg):
 
     reader.update_feed(feed_arg(two))
 
-    assert set(reader.get_feeds()) == {one, two}
+    assert sorted(reader.get_feeds(), key=lambda f: f.url) == [one, two]
     assert reader.get_feed(one.url) == one
     assert reader.get_feed(two.url) == two
     assert set(reader.get_entries()) == {
@@ -1085,19 +1083,19 @@ def test_mark_as_read_unread(reader, entry_arg):
     assert not entry.read
 
     reader.mark_entry_as_read(entry_arg(entry_with_feed))
-    (entry,) = list(reader.get_entries())
+    entry = next(reader.get_entries())
     assert entry.read
 
     reader.mark_entry_as_read(entry_arg(entry_with_feed))
-    (entry,) = list(reader.get_entries())
+    entry = next(reader.get_entries())
     assert entry.read
 
     reader.mark_entry_as_unread(entry_arg(entry_with_feed))
-    (entry,) = list(reader.get_entries())
+    entry = next(reader.get_entries())
     assert not entry.read
 
     reader.mark_entry_as_unread(entry_arg(entry_with_feed))
-    (entry,) = list(reader.get_entries())
+    entry = next(reader.get_entries())
     assert not entry.read
 
 
@@ -1141,10 +1139,7 @@ def test_get_entries_random(reader, get_entries, chunk_size):
     reader._parser = parser
 
     feed = parser.feed(1, datetime(2010, 1, 1))
-    one = parser.entry(1, 1, datetime(2010, 1, 1))
-    two = parser.entry(1, 2, datetime(2010, 1, 1))
-    three = parser.entry(1, 3, datetime(2010, 1, 1))
-    four = parser.entry(1, 4, datetime(2010, 1, 1))
+    parser.add_entries(1, [(n, datetime(2010, 1, 1)) for n in range(1, 5)])
 
     reader.add_feed(feed.url)
     reader.update_feeds()
@@ -1192,7 +1187,7 @@ def test_add_remove_get_feeds(reader, feed_arg):
     two = parser.feed(2, datetime(2010, 2, 1))
     entry_two = parser.entry(2, 2, datetime(2010, 2, 1))
 
-    assert set(reader.get_feeds()) == set()
+    assert list(reader.get_feeds()) == []
     with pytest.raises(FeedNotFoundError) as excinfo:
         assert reader.get_feed(feed_arg(one))
     assert excinfo.value.url == one.url
@@ -1200,7 +1195,7 @@ def test_add_remove_get_feeds(reader, feed_arg):
 
     assert reader.get_feed(feed_arg(one), None) == None
     assert reader.get_feed(feed_arg(one), 1) == 1
-    assert set(reader.get_entries()) == set()
+    assert list(reader.get_entries()) == []
 
     with pytest.raises(FeedNotFoundError) as excinfo:
         reader.delete_feed(feed_arg(one))
@@ -1214,11 +1209,11 @@ def test_add_remove_get_feeds(reader, feed_arg):
     reader.add_feed(feed_arg(one))
     reader.add_feed(feed_arg(two))
 
-    assert set(reader.get_feeds()) == {
+    assert list(reader.get_feeds()) == [
         Feed(f.url, added=datetime(2010, 1, 1)) for f in (one, two)
-    }
+    ]
     assert reader.get_feed(feed_arg(one)) == Feed(one.url, added=datetime(2010, 1, 1))
-    assert set(reader.get_entries()) == set()
+    assert list(reader.get_entries()) == []
 
     with pytest.raises(FeedExistsError) as excinfo:
         reader.add_feed(feed_arg(one))
@@ -1240,14 +1235,14 @@ def test_add_remove_get_feeds(reader, feed_arg):
         feed=two, added=datetime(2010, 1, 2), last_updated=datetime(2010, 1, 2)
     )
 
-    assert set(reader.get_feeds()) == {one, two}
+    assert list(reader.get_feeds()) == [one, two]
     assert reader.get_feed(feed_arg(one)) == one
-    assert set(reader.get_entries()) == {entry_one, entry_two}
+    assert list(reader.get_entries()) == [entry_two, entry_one]
 
     reader.delete_feed(feed_arg(one))
-    assert set(reader.get_feeds()) == {two}
+    assert list(reader.get_feeds()) == [two]
     assert reader.get_feed(feed_arg(one), None) == None
-    assert set(reader.get_entries()) == {entry_two}
+    assert list(reader.get_entries()) == [entry_two]
 
     with pytest.raises(FeedNotFoundError) as excinfo:
         reader.delete_feed(feed_arg(one))
@@ -1941,9 +1936,9 @@ def test_updates_enabled(reader):
     # disable_feed_updates can be called twice
     reader.disable_feed_updates(one)
 
-    one = parser.feed(1, datetime(2010, 1, 2))
+    one = parser.touch_feed(1, datetime(2010, 1, 2))
     one_one = parser.entry(1, 1, datetime(2010, 1, 2))
-    two = parser.feed(2, datetime(2010, 1, 2))
+    two = parser.touch_feed(2, datetime(2010, 1, 2))
     two_one = parser.entry(2, 1, datetime(2010, 1, 2))
 
     # update_feeds skips feeds with updates_enabled == False
@@ -1962,9 +1957,9 @@ def test_updates_enabled(reader):
     assert reader.get_feed(one).updated == datetime(2010, 1, 2)
     assert reader.get_entry(one_one).updated == datetime(2010, 1, 2)
 
-    one = parser.feed(1, datetime(2010, 1, 3))
+    one = parser.touch_feed(1, datetime(2010, 1, 3))
     one_one = parser.entry(1, 1, datetime(2010, 1, 3))
-    two = parser.feed(2, datetime(2010, 1, 3))
+    two = parser.touch_feed(2, datetime(2010, 1, 3))
     two_one = parser.entry(2, 1, datetime(2010, 1, 3))
 
     # update_feeds skips feeds with updates_enabled == False (again)
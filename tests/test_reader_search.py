@@ -46,10 +46,9 @@ def reader_without_and_with_entries(request, make_reader):
         summary='summary',
         content=[Content('content'), Content('another content')],
     )
-    parser.entry(1, 2, datetime(2010, 1, 1), title='feed one')
-    parser.entry(1, 3, datetime(2010, 1, 1), title='feed one')
-    parser.entry(1, 4, datetime(2010, 1, 1), title='feed one')
-    parser.entry(1, 5, datetime(2010, 1, 1), title='feed one')
+    parser.add_entries(
+        1, [(n, datetime(2010, 1, 1)) for n in range(2, 6)], title='feed one'
+    )
 
     reader.add_feed(feed.url)
     reader.update_feeds()
@@ -1,9 +1,12 @@
+import shutil
+from contextlib import closing
 from datetime import timedelta
 from functools import partial
 
 import pytest
 
 from fakeparser import Parser
+from reader import make_reader as original_make_reader
 from utils import rename_argument
 from utils import utc_datetime as datetime
 
@@ -66,129 +69,152 @@ def test_entries_recent_feed_order(reader, chunk_size, get_entries, entry_kwargs
     assert [eval(e.id)[1] for e in get_entries(reader)] == [3, 2, 4, 1]
 
 
-@rename_argument('get_entries', 'get_entries_recent')
-@pytest.mark.parametrize('reverse', [False, True], ids=['forward', 'reverse'])
-def test_entries_recent_all(reader, chunk_size, get_entries, reverse):
-    """Entries should be sorted descending by (with decreasing priority):
+@pytest.fixture(scope='module', params=[False, True], ids=['forward', 'reverse'])
+def recent_all_db_path(request, tmp_path_factory):
+    """Database for test_entries_recent_all().
 
-    * entry first updated epoch
-      if the feed is not new
-      else entry published or updated or first updated epoch
-    * entry published or updated or first updated epoch
-    * feed URL
-    * entry last updated
-    * order of entry in feed
-    * entry id
-
-    https://github.com/lemon24/reader/issues/97
-    https://github.com/lemon24/reader/issues/106
-    https://github.com/lemon24/reader/issues/113
-    https://github.com/lemon24/reader/issues/279
+    Updating the feeds is the expensive part of the test, and the result
+    only depends on reverse, so it is done once per module (per reverse),
+    instead of once for every chunk_size / get_entries combination.
 
     """
+    reverse = request.param
+    db_path = str(tmp_path_factory.mktemp('recent_all') / 'db.sqlite')
 
-    reader._storage.chunk_size = chunk_size
-    reader._parser = parser = Parser()
+    with closing(original_make_reader(db_path)) as reader:
+        reader._parser = parser = Parser()
 
-    for feed in [1, 2, 3]:
-        reader.add_feed(parser.feed(feed))
-
-    def update_with_published_or_updated(offset, kind):
-        parser.entries[1].clear()
-
-        functions = [
-            partial(
-                parser.entry,
-                1,
-                offset + 3,
-                title='entry by published or updated, {kind}, mid',
-                published=datetime(2010, 1, 6, 12),
-            ),
-            partial(
-                parser.entry,
-                1,
-                offset + 1,
-                title='entry by published or updated, {kind}, newer',
-                updated=datetime(2010, 1, 11, 12),
-            ),
-            partial(
-                parser.entry,
-                1,
-                offset + 2,
-                title='entry by published or updated, {kind}, older',
-                published=datetime(2010, 1, 1),
-                # ignored
-                updated=datetime(2010, 1, 7),
-            ),
-        ]
-        if reverse:
-            functions = reversed(functions)
+        for feed in [1, 2, 3]:
+            reader.add_feed(parser.feed(feed))
 
-        for fn in functions:
-            fn()
+        def update_with_published_or_updated(offset, kind):
+            parser.entries[1].clear()
 
-        reader.update_feeds()
+            functions = [
+                partial(
+                    parser.entry,
+                    1,
+                    offset + 3,
+                    title='entry by published or updated, {kind}, mid',
+                    published=datetime(2010, 1, 6, 12),
+                ),
+                partial(
+                    parser.entry,
+                    1,
+                    offset + 1,
+                    title='entry by published or updated, {kind}, newer',
+                    updated=datetime(2010, 1, 11, 12),
+                ),
+                partial(
+                    parser.entry,
+                    1,
+                    offset + 2,
+                    title='entry by published or updated, {kind}, older',
+                    published=datetime(2010, 1, 1),
+                    # ignored
+                    updated=datetime(2010, 1, 7),
+                ),
+            ]
+            if reverse:
+                functions = reversed(functions)
+
+            for fn in functions:
+                fn()
 
-    def by_published_or_updated_first_update():
-        # first update, ignored
-        reader._now = lambda: datetime(2010, 1, 1)
-        update_with_published_or_updated(0, 'first update')
+            reader.update_feeds()
 
-    def by_id():
-        reader._now = lambda: datetime(2010, 1, 6)
+        def by_published_or_updated_first_update():
+            # first update, ignored
+            reader._now = lambda: datetime(2010, 1, 1)
+            update_with_published_or_updated(0, 'first update')
 
-        functions = [
-            partial(parser.entry, 1, 6, title='entry by id, older'),
-            partial(parser.entry, 1, 7, title='entry by id, newer'),
-        ]
-        if reverse:
-            functions = reversed(functions)
+        def by_id():
+            reader._now = lambda: datetime(2010, 1, 6)
+
+            functions = [
+                partial(parser.entry, 1, 6, title='entry by id, older'),
+                partial(parser.entry, 1, 7, title='entry by id, newer'),
+            ]
+            if reverse:
+                functions = reversed(functions)
+
+            for fn in functions:
+                parser.entries[1].clear()
+                fn()
+                reader.update_feeds()
+
+        def by_feed_order():
+            reader._now = lambda: datetime(2010, 1, 11)
 
-        for fn in functions:
             parser.entries[1].clear()
-            fn()
+            parser.entry(1, 11, title='entry by feed order, newer')
+            parser.entry(1, 12, title='entry by feed order, older')
             reader.update_feeds()
 
-    def by_feed_order():
-        reader._now = lambda: datetime(2010, 1, 11)
+        def by_feed_url():
+            reader._now = lambda: datetime(2010, 1, 16)
 
-        parser.entries[1].clear()
-        parser.entry(1, 11, title='entry by feed order, newer')
-        parser.entry(1, 12, title='entry by feed order, older')
-        reader.update_feeds()
+            functions = [
+                partial(parser.entry, 2, 1, title='entry by feed url, older'),
+                partial(parser.entry, 3, 1, title='entry by feed url, newer'),
+            ]
+            if reverse:
+                functions = reversed(functions)
+
+            for fn in functions:
+                fn()
+
+            reader.update_feeds()
 
-    def by_feed_url():
-        reader._now = lambda: datetime(2010, 1, 16)
+        def by_published_or_updated_not_first_update():
+            reader._now = lambda: datetime(2010, 1, 21)
+            update_with_published_or_updated(20, 'not first update')
 
-        functions = [
-            partial(parser.entry, 2, 1, title='entry by feed url, older'),
-            partial(parser.entry, 3, 1, title='entry by feed url, newer'),
+        updates = [by_published_or_updated_first_update]
+        other_updates = [
+            by_id,
+            by_feed_order,
+            by_feed_url,
+            by_published_or_updated_not_first_update,
         ]
         if reverse:
-            functions = reversed(functions)
+            other_updates = list(reversed(other_updates))
+        updates += other_updates
 
-        for fn in functions:
-            fn()
+        for update in updates:
+            update()
 
-        reader.update_feeds()
+    return db_path
 
-    def by_published_or_updated_not_first_update():
-        reader._now = lambda: datetime(2010, 1, 21)
-        update_with_published_or_updated(20, 'not first update')
 
-    updates = [by_published_or_updated_first_update]
-    other_updates = [
-        by_id,
-        by_feed_order,
-        by_feed_url,
-        by_published_or_updated_not_first_update,
-    ]
-    if reverse:
-        other_updates = list(reversed(other_updates))
-    updates += other_updates
+@rename_argument('get_entries', 'get_entries_recent')
+def test_entries_recent_all(
+    recent_all_db_path, tmp_path, make_reader, chunk_size, get_entries
+):
+    """Entries should be sorted descending by (with decreasing priority):
+
+    * entry first updated epoch
+      if the feed is not new
+      else entry published or updated or first updated epoch
+    * entry published or updated or first updated epoch
+    * feed URL
+    * entry last updated
+    * order of entry in feed
+    * entry id
 
-    for update in updates:
-        update()
+    https://github.com/lemon24/reader/issues/97
+    https://github.com/lemon24/reader/issues/106
+    https://github.com/lemon24/reader/issues/113
+    https://github.com/lemon24/reader/issues/279
+
+    """
+
+    # get_entries.after_update() may change the database, use a copy
+    db_path = str(tmp_path / 'db.sqlite')
+    shutil.copyfile(recent_all_db_path, db_path)
+
+    reader = make_reader(db_path)
+    reader._storage.chunk_size = chunk_size
 
     get_entries.after_update(reader)
 
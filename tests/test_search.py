@@ -104,7 +104,9 @@ def test_iter_locked(db_path, iter_stuff, chunk_size):
 
     """
     from test_storage import check_iter_locked
+    from test_storage import make_iter_locked_db
 
+    make_iter_locked_db(db_path)
     check_iter_locked(db_path, set_search_and_update, iter_stuff, chunk_size)
 
 
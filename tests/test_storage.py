@@ -1,4 +1,5 @@
 import os
+import shutil
 import sqlite3
 import sys
 import threading
@@ -411,14 +412,24 @@ def iter_get_tags(storage):
         iter_get_tags,
     ],
 )
-def test_iter_locked(db_path, iter_stuff, chunk_size):
+def test_iter_locked(iter_locked_template_path, db_path, iter_stuff, chunk_size):
     """Methods that return an iterable shouldn't block the underlying storage
     if the iterable is not consumed."""
+    shutil.copyfile(iter_locked_template_path, db_path)
     check_iter_locked(db_path, None, iter_stuff, chunk_size)
 
 
-def check_iter_locked(db_path, pre_stuff, iter_stuff, chunk_size):
-    """Actual implementation of test_errors_locked, so it can be reused."""
+@pytest.fixture(scope='module')
+def iter_locked_template_path(tmp_path_factory):
+    """A make_iter_locked_db() database, created only once per module;
+    tests should use a copy, since check_iter_locked() changes it."""
+    db_path = str(tmp_path_factory.mktemp('iter_locked') / 'db.sqlite')
+    make_iter_locked_db(db_path)
+    return db_path
+
+
+def make_iter_locked_db(db_path):
+    """Create the database used by check_iter_locked()."""
 
     storage = Storage(db_path)
     # WAL provides more concurrency; some things won't to block with it enabled.
@@ -454,6 +465,17 @@ def check_iter_locked(db_path, pre_stuff, iter_stuff, chunk_size):
     storage.set_tag(('two',), '1', 1)
     storage.set_tag(('two',), '2', 2)
 
+    storage.close()
+
+
+def check_iter_locked(db_path, pre_stuff, iter_stuff, chunk_size):
+    """Actual implementation of test_errors_locked, so it can be reused.
+
+    db_path must be a database created by make_iter_locked_db().
+
+    """
+    storage = Storage(db_path)
+
     if pre_stuff:
         pre_stuff(storage)
 
@@ -462,9 +484,9 @@ def check_iter_locked(db_path, pre_stuff, iter_stuff, chunk_size):
 
     # shouldn't raise an exception
     storage = Storage(db_path, timeout=0)
-    storage.set_entry_read((feed.url, entry.id), 1, None)
+    storage.set_entry_read(('one', 'entry'), 1, None)
     storage = Storage(db_path, timeout=0)
-    storage.set_entry_read((feed.url, entry.id), 0, None)
+    storage.set_entry_read(('one', 'entry'), 0, None)
 
 
 def test_update_feed_last_updated_not_found(db_path):
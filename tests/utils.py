@@ -112,3 +112,13 @@ def utc_datetime(*args, **kwargs):
 
 def parametrize_dict(names, values, **kwargs):
     return pytest.mark.parametrize(names, values.values(), ids=values, **kwargs)
+
+
+def disable_fsync(reader):
+    """Don't fsync on commit, for throwaway on-disk databases.
+
+    Only affects the connection of the current thread.
+    journal_mode stays WAL, since some tests rely on concurrent access.
+
+    """
+    reader._storage.get_db().execute("PRAGMA synchronous = OFF;")